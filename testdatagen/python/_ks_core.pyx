@@ -0,0 +1,33 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled KS statistic kernel (optional; see setup.py)
+"""
+
+from libc.math cimport erf
+
+
+def ks_norm(const double[::1] sorted_x, double mean, double std):
+    """
+    Two-sided KS statistic of a sorted sample against Normal(mean, std)
+
+    Args:
+        sorted_x: C-contiguous float64 array, sorted ascending
+        mean: Mean of the reference distribution
+        std: Standard deviation of the reference distribution
+
+    Returns:
+        D statistic
+    """
+    cdef Py_ssize_t n = sorted_x.shape[0], i
+    cdef double scale = std * 1.4142135623730951
+    cdef double inv_n = 1.0 / n
+    cdef double cdf, d_plus = 0.0, d_minus = 0.0
+
+    for i in range(n):
+        cdf = 0.5 * (1.0 + erf((sorted_x[i] - mean) / scale))
+        if (i + 1) * inv_n - cdf > d_plus:
+            d_plus = (i + 1) * inv_n - cdf
+        if cdf - i * inv_n > d_minus:
+            d_minus = cdf - i * inv_n
+
+    return d_plus if d_plus > d_minus else d_minus
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Numba JIT-compiled kernels, imported by kernels only on first use
+
+Importing numba takes hundreds of milliseconds, so it is kept out of the
+start-up path of scripts that never reach one of these kernels.
+"""
+
+import math
+import numba
+import numpy as np
+
+SQRT2 = math.sqrt(2.0)
+LOG_SQRT_2PI = 0.5 * math.log(2.0 * math.pi)
+
+
+@numba.njit(fastmath=True, cache=True)
+def ks_norm(sorted_data, mean, std):
+    n = sorted_data.shape[0]
+    scale = std * SQRT2
+    d_plus = 0.0
+    d_minus = 0.0
+    for i in range(n):
+        cdf = 0.5 * (1.0 + math.erf((sorted_data[i] - mean) / scale))
+        d_plus = max(d_plus, (i + 1) / n - cdf)
+        d_minus = max(d_minus, cdf - i / n)
+    return max(d_plus, d_minus)
+
+
+@numba.njit(fastmath=True, cache=True)
+def mean_std(x):
+    # Sums of deviations from the first value (shifted-data algorithm):
+    # one pass that vectorizes, unlike Welford's per-element division,
+    # and free of the cancellation of raw sums when the mean is large
+    n = x.shape[0]
+    shift = x[0]
+    s1 = 0.0
+    s2 = 0.0
+    for i in range(n):
+        d = x[i] - shift
+        s1 += d
+        s2 += d * d
+    offset = s1 / n
+    return shift + offset, math.sqrt(max(s2 / n - offset * offset, 0.0))
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def ks_norm_many(sorted2d, out_d, out_mean, out_std, estimate):
+    # Rows are independent, so each thread tests its own rows
+    for r in numba.prange(sorted2d.shape[0]):
+        row = sorted2d[r]
+        if estimate:
+            out_mean[r], out_std[r] = mean_std(row)
+        if out_std[r] > 0:
+            out_d[r] = ks_norm(row, out_mean[r], out_std[r])
+        else:
+            out_d[r] = np.nan
+
+
+@numba.njit(fastmath=True, cache=True)
+def log_ndtr(z):
+    if z > 0.0:
+        return math.log1p(-0.5 * math.erfc(z / SQRT2))
+    if z > -37.0:
+        return math.log(0.5 * math.erfc(-z / SQRT2))
+    # erfc underflows here; use the asymptotic series of the normal tail
+    r = 1.0 / (z * z)
+    series = 1.0 - r * (1.0 - r * (3.0 - r * (15.0 - r * 105.0)))
+    return -0.5 * z * z - math.log(-z) - LOG_SQRT_2PI + math.log(series)
+
+
+@numba.njit(fastmath=True, cache=True)
+def ad_norm(sorted_data, mean, std):
+    n = sorted_data.shape[0]
+    total = 0.0
+    for i in range(n):
+        z_low = (sorted_data[i] - mean) / std
+        z_high = (sorted_data[n - 1 - i] - mean) / std
+        # log CDF of the i-th and log SF of the (n-1-i)-th order statistic
+        total += (2 * i + 1) * (log_ndtr(z_low) + log_ndtr(-z_high))
+    return -n - total / n
@@ -5,9 +5,11 @@ Perform Chi-squared test for goodness of fit
 
 import sys
 import json
-import argparse
 import numpy as np
-from scipy import stats
+
+import kernels
+import cli
+import serialization
 
 def chi_squared_test(observed, expected, alpha=0.05):
     """
@@ -23,37 +25,61 @@ def chi_squared_test(observed, expected, alpha=0.05):
     Returns:
         dict with statistic, pvalue, and significant flag
     """
-    observed = np.array(observed)
-    expected = np.array(expected)
+    observed = np.asarray(observed, dtype=np.float64)
+    expected = np.asarray(expected, dtype=np.float64)
 
     if len(observed) != len(expected):
         raise ValueError("Observed and expected must have same length")
 
-    if np.any(expected == 0):
-        raise ValueError("Expected frequencies cannot be zero")
+    if not expected.min() > 0:
+        raise ValueError("Expected frequencies must be positive")
 
-    statistic, pvalue = stats.chisquare(observed, expected)
+    statistic, pvalue = kernels.chi_squared(observed, expected)
 
     return {
         'statistic': float(statistic),
         'pvalue': float(pvalue),
-        'significant': pvalue < alpha,
+        'significant': bool(pvalue < alpha),
         'alpha': alpha
     }
 
-def main():
-    parser = argparse.ArgumentParser(description='Perform Chi-squared test')
-    parser.add_argument('--observed', type=str, required=True, help='Observed frequencies (JSON array)')
-    parser.add_argument('--expected', type=str, required=True, help='Expected frequencies (JSON array)')
-    parser.add_argument('--alpha', type=float, default=0.05, help='Significance level (default: 0.05)')
+def run(args):
+    """
+    Handle a Chi-squared test request.
+
+    Args:
+        args: dict with 'observed', 'expected' and optional 'alpha'
 
-    args = parser.parse_args()
+    Returns:
+        dict with statistic, pvalue, and significant flag
+    """
+    return chi_squared_test(args['observed'], args['expected'], args.get('alpha', 0.05))
 
+def main():
     try:
-        observed = json.loads(args.observed)
-        expected = json.loads(args.expected)
+        # --observed/--expected: JSON arrays; --binary: read observed then
+        # expected frequencies from stdin as raw float64 (--n values each)
+        args = cli.parse_args(sys.argv[1:], {
+            'observed': (str, None),
+            'expected': (str, None),
+            'n': (int, None),
+            'alpha': (float, 0.05)
+        }, flags=('binary',), required=() if '--binary' in sys.argv else ('observed', 'expected'))
+
+        if args['binary']:
+            values = serialization.read_binary(2 * args['n'] if args['n'] is not None else -1)
+            if len(values) % 2:
+                raise ValueError("Binary input must hold observed and expected arrays of equal length")
+            observed, expected = np.split(values, 2)
+        else:
+            observed = serialization.loads(args['observed'])
+            expected = serialization.loads(args['expected'])
 
-        result = chi_squared_test(observed, expected, args.alpha)
+        result = run({
+            'observed': observed,
+            'expected': expected,
+            'alpha': args['alpha']
+        })
         print(json.dumps(result))
         sys.exit(0)
     except Exception as e:
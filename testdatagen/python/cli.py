@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Minimal command-line option parsing for the standalone scripts
+
+Replaces argparse, whose imports (gettext, re, ...) are a noticeable part
+of the start-up time of a script that runs once per call.
+"""
+
+def parse_args(argv, options, flags=(), required=()):
+    """
+    Parse `--name value`, `--name=value` and bare `--flag` arguments
+
+    Args:
+        argv: Argument list without the program name (e.g. sys.argv[1:])
+        options: Dict mapping option name to (type, default)
+        flags: Names of boolean switches that take no value
+        required: Names of options that must be given
+
+    Returns:
+        Dictionary of option and flag values keyed by name
+
+    Raises:
+        ValueError: On unknown, missing or malformed arguments
+    """
+    args = {name: default for name, (_, default) in options.items()}
+    args.update((name, False) for name in flags)
+
+    it = iter(argv)
+    for arg in it:
+        if not arg.startswith('--'):
+            raise ValueError(f'Unexpected argument: {arg}')
+
+        name, sep, value = arg[2:].partition('=')
+
+        if name in flags and not sep:
+            args[name] = True
+            continue
+
+        if name not in options:
+            raise ValueError(f'Unknown option: --{name}')
+
+        if not sep:
+            value = next(it, None)
+            if value is None:
+                raise ValueError(f'Option --{name} expects a value')
+
+        try:
+            args[name] = options[name][0](value)
+        except ValueError:
+            raise ValueError(f'Invalid value for --{name}: {value}') from None
+
+    missing = [f'--{name}' for name in required if args[name] is None]
+    if missing:
+        raise ValueError(f"Missing required option(s): {', '.join(missing)}")
+
+    return args
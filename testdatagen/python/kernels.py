@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Numeric kernels for the statistical tests
+
+These bypass scipy's generic distribution machinery for the hot paths.
+Acceleration is optional: the Cython extension (built with setup.py) is
+used when present, then Numba JIT-compiled kernels when Numba is installed,
+otherwise vectorized numpy/scipy.special versions. Numba is imported on
+first use of a kernel that needs it, not with this module.
+"""
+
+import math
+import functools
+import warnings
+import numpy as np
+from scipy import special, stats
+from scipy.linalg.blas import ddot
+
+try:
+    import _ks_core
+except ImportError:
+    _ks_core = None
+
+SQRT2 = math.sqrt(2.0)
+
+# Same relative tolerance stats.chisquare uses for its sum check
+_SUM_RTOL = np.finfo(np.float64).eps ** 0.5
+
+# Below this length the BLAS call overhead outweighs its SIMD reduction
+_BLAS_MIN_SIZE = 64
+
+
+def dot(x, y):
+    """
+    Dot product of two 1-D float64 arrays, via BLAS ddot for long inputs
+    """
+    if x.shape[0] < _BLAS_MIN_SIZE:
+        return float(np.einsum('i,i->', x, y))
+    return float(ddot(np.ascontiguousarray(x), np.ascontiguousarray(y)))
+
+
+def ks_statistic(cdf):
+    """
+    Two-sided KS statistic from reference CDF values of sorted samples
+
+    Args:
+        cdf: CDF evaluated at the sorted sample, shape (..., n); each
+             row along the last axis is one sample
+
+    Returns:
+        D statistic per sample (scalar for 1-D input)
+    """
+    n = cdf.shape[-1]
+    d_plus = np.max(np.arange(1, n + 1) / n - cdf, axis=-1)
+    d_minus = np.max(cdf - np.arange(n) / n, axis=-1)
+    return np.maximum(d_plus, d_minus)
+
+
+@functools.lru_cache(maxsize=256)
+def _kstwo_sf_for_n(n):
+    """
+    Scalar kstwo survival function for samples of size n
+
+    Inside the support this calls the distribution's _sf hook directly,
+    skipping rv_continuous's generic argument checking and broadcasting,
+    which is about half the cost of a scalar kstwo.sf call.
+    """
+    kstwo = stats.distributions.kstwo
+
+    # _sf is private; kstwo_gen._sf(x, n) = kolmogn(n, x, cdf=False) in
+    # scipy 1.10.1, 1.12.0, 1.14.1 and 1.17.1. Use the public sf if a
+    # release stops overriding it (rv_continuous's default is 1 - cdf)
+    if '_sf' not in vars(type(kstwo)):
+        return lambda statistic: float(kstwo.sf(statistic, n))
+
+    def sf(statistic):
+        if 0 < statistic < 1:
+            return float(kstwo._sf(statistic, n))
+        return float(kstwo.sf(statistic, n))
+
+    return sf
+
+
+def ks_pvalue(statistic, n):
+    """
+    Exact two-sided KS p-value for statistic(s) from samples of size n
+    """
+    if np.ndim(statistic) == 0:
+        return float(np.clip(_kstwo_sf_for_n(int(n))(statistic), 0.0, 1.0))
+    return np.clip(stats.distributions.kstwo.sf(statistic, n), 0.0, 1.0)
+
+
+def _as_float_array(data):
+    # float32 samples stay float32 (half the memory traffic); anything
+    # else is converted to float64
+    data = np.asarray(data)
+    if data.dtype == np.float32:
+        return data
+    return np.asarray(data, dtype=np.float64)
+
+
+def _ks_norm_numpy(sorted_data, mean, std):
+    return ks_statistic(special.ndtr((sorted_data - mean) / std))
+
+
+def _ad_norm_numpy(sorted_data, mean, std):
+    n = sorted_data.shape[0]
+    z = (sorted_data - mean) / std
+    logs = special.log_ndtr(z)
+    logs += special.log_ndtr(-z[::-1])
+    return -n - dot(np.arange(1.0, 2 * n, 2.0), logs) / n
+
+
+def _mean_std_numpy(x):
+    mean = x.mean()
+    centered = x - mean
+    return mean, math.sqrt(dot(centered, centered) / x.shape[0])
+
+
+@functools.lru_cache(maxsize=None)
+def _load_numba():
+    """
+    The Numba kernel module, imported on first use; None without Numba
+    """
+    try:
+        import _numba_kernels
+    except ImportError:
+        return None
+    return _numba_kernels
+
+
+def _ks_norm_kernel(dtype):
+    # The Cython kernel is float64-only; the others also take float32
+    if dtype == np.float64 and _ks_core is not None:
+        return _ks_core.ks_norm
+    nb = _load_numba()
+    return nb.ks_norm if nb is not None else _ks_norm_numpy
+
+
+def _mean_std_kernel():
+    nb = _load_numba()
+    return nb.mean_std if nb is not None else _mean_std_numpy
+
+
+def _ad_norm_kernel():
+    nb = _load_numba()
+    return nb.ad_norm if nb is not None else _ad_norm_numpy
+
+
+def mean_std(data):
+    """
+    Mean and population standard deviation (ddof=0) of a 1-D sample
+
+    With numba this is a single pass over the data; otherwise it is two
+    passes, versus three for separate np.mean and np.std calls.
+
+    Args:
+        data: Sample data (array-like; float32 arrays are not widened)
+
+    Returns:
+        Tuple of (mean, std)
+    """
+    data = _as_float_array(data)
+
+    if data.shape[0] == 0:
+        raise ValueError("Data must not be empty")
+
+    mean, std = _mean_std_kernel()(data)
+    return float(mean), float(std)
+
+
+def ks_norm(data, mean, std):
+    """
+    One-sample two-sided KS test against Normal(mean, std)
+
+    Equivalent to stats.kstest(data, 'norm', args=(mean, std)) with the
+    exact p-value, but computes the CDF and D statistic in one pass.
+
+    Args:
+        data: Sample data (array-like; float32 arrays are not widened)
+        mean: Mean of the reference distribution
+        std: Standard deviation of the reference distribution
+
+    Returns:
+        Tuple of (statistic, p_value)
+    """
+    if not std > 0:
+        statistic, p_value = stats.kstest(data, stats.norm.cdf, args=(mean, std))
+        return float(statistic), float(p_value)
+
+    sorted_data = np.sort(_as_float_array(data))
+    n = sorted_data.shape[0]
+
+    # np.sort puts NaN last. The compiled kernels would skip NaN CDF values
+    # in their max(), so return NaN like stats.kstest instead
+    if (n and np.isnan(sorted_data[-1])) or math.isnan(mean):
+        return math.nan, math.nan
+
+    kernel = _ks_norm_kernel(sorted_data.dtype)
+    statistic = float(kernel(sorted_data, float(mean), float(std)))
+    p_value = float(ks_pvalue(statistic, n))
+
+    return statistic, p_value
+
+
+# Normal-case Anderson-Darling critical values (15%, 10%, 5%, 2.5%, 1%) and
+# their small-sample adjustment: older scipy releases use the first form,
+# newer ones the second
+_AD_NORM_FORMS = (
+    (np.array([0.576, 0.656, 0.787, 0.918, 1.092]), lambda n: 1.0 + 4.0 / n - 25.0 / n**2),
+    (np.array([0.561, 0.631, 0.752, 0.873, 1.035]), lambda n: 1.0 + 0.75 / n + 2.25 / n**2),
+)
+_AD_PROBE_N = 10
+
+
+@functools.lru_cache(maxsize=None)
+def _ad_norm_form():
+    """
+    The (table, adjustment) form the installed scipy uses; None if neither
+    """
+    # critical_values is deprecated as of scipy 1.17, which warns on this
+    # call; the probe runs once, so the per-n values need no further calls
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        probe = stats.anderson(np.arange(_AD_PROBE_N, dtype=np.float64), dist='norm')
+        probe = np.asarray(probe.critical_values)
+
+    for table, adjust in _AD_NORM_FORMS:
+        if np.allclose(probe, np.round(table / adjust(_AD_PROBE_N), 3)):
+            return table, adjust
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _ad_norm_critical(n):
+    form = _ad_norm_form()
+    if form is not None:
+        table, adjust = form
+        critical = np.round(table / adjust(n), 3)
+    else:
+        # An unrecognized table: take the values from stats.anderson itself
+        # (any non-constant sample of size n will do)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            result = stats.anderson(np.arange(n, dtype=np.float64), dist='norm')
+        critical = np.array(result.critical_values)
+    critical.setflags(write=False)
+    return critical
+
+
+def anderson_norm(data):
+    """
+    Anderson-Darling test for normality with estimated mean and std
+
+    Equivalent to stats.anderson(data, dist='norm'), but evaluates the
+    log CDF/SF terms and their weighted sum in one pass per order
+    statistic instead of through scipy's distribution objects.
+
+    Args:
+        data: Sample data (array-like, n >= 2)
+
+    Returns:
+        Tuple of (statistic, critical_values) with critical values for
+        the 15%, 10%, 5%, 2.5% and 1% significance levels
+    """
+    sorted_data = np.sort(np.asarray(data, dtype=np.float64))
+    n = sorted_data.shape[0]
+
+    mean, std = mean_std(sorted_data)
+    std *= math.sqrt(n / (n - 1))
+
+    if not 0 < std < np.inf:
+        result = stats.anderson(sorted_data, dist='norm')
+        return float(result.statistic), result.critical_values
+
+    statistic = float(_ad_norm_kernel()(sorted_data, mean, std))
+    return statistic, _ad_norm_critical(n)
+
+
+def ks_norm_many(data, mean=None, std=None):
+    """
+    Two-sided KS tests of each row of a 2-D array against a Normal
+
+    Rows are sorted with numpy (much faster than numba's sort), then with
+    numba their moments and D statistics are computed in parallel across
+    cores; otherwise in one vectorized numpy pass. Rows containing NaN or
+    with a non-positive std get a NaN statistic.
+
+    Args:
+        data: 2-D float64 ndarray, one sample per row
+        mean: Per-row means (1-D); estimated from each row when None
+        std: Per-row standard deviations (1-D, ddof=0); estimated when None
+
+    Returns:
+        Tuple of (statistics, p_values, means, stds) 1-D ndarrays
+    """
+    n_rows, n = data.shape
+    estimate = mean is None or std is None
+
+    if estimate:
+        mean = np.empty(n_rows)
+        std = np.empty(n_rows)
+    else:
+        mean = np.array(mean, dtype=np.float64)
+        std = np.array(std, dtype=np.float64)
+
+    sorted_data = np.sort(data, axis=1)
+
+    nb = _load_numba()
+
+    if nb is not None:
+        statistics = np.empty(n_rows)
+        nb.ks_norm_many(sorted_data, statistics, mean, std, estimate)
+        # As in ks_norm: the kernel's max() skips NaN, which sorts last
+        statistics[np.isnan(sorted_data[:, -1]) | np.isnan(mean)] = np.nan
+    else:
+        if estimate:
+            mean[:] = sorted_data.mean(axis=1)
+            std[:] = sorted_data.std(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = (sorted_data - mean[:, None]) / std[:, None]
+        statistics = ks_statistic(special.ndtr(z))
+        statistics[~(std > 0)] = np.nan
+
+    return statistics, ks_pvalue(statistics, n), mean, std
+
+
+def chi_squared(observed, expected):
+    """
+    Pearson chi-squared goodness of fit test on 1-D frequency arrays
+
+    Equivalent to stats.chisquare(observed, expected) for equal-length
+    1-D inputs with positive expected frequencies, without its generic
+    axis/broadcast handling. Callers validate lengths and positivity.
+
+    Args:
+        observed: Observed frequencies (1-D float64 ndarray)
+        expected: Expected frequencies (1-D float64 ndarray)
+
+    Returns:
+        Tuple of (statistic, p_value)
+    """
+    observed_sum = observed.sum()
+    expected_sum = expected.sum()
+
+    if abs(observed_sum - expected_sum) > _SUM_RTOL * min(observed_sum, expected_sum):
+        raise ValueError(
+            'Sum of observed frequencies must agree with sum of expected frequencies'
+        )
+
+    diff = observed - expected
+    statistic = dot(diff, diff / expected)
+    p_value = float(stats.distributions.chi2.sf(statistic, observed.size - 1))
+
+    return statistic, p_value
+
+
+# Royston (1995) AS R94 polynomial coefficients
+_SW_C1 = (0.0, 0.221157, -0.147981, -2.07119, 4.434685, -2.706056)
+_SW_C2 = (0.0, 0.042981, -0.293762, -1.752461, 5.682633, -3.582633)
+_SW_C3 = (0.544, -0.39978, 0.025054, -6.714e-4)
+_SW_C4 = (1.3822, -0.77857, 0.062767, -0.0020322)
+_SW_C5 = (-1.5861, -0.31082, -0.083751, 0.0038915)
+_SW_C6 = (-0.4803, -0.082676, 0.0030302)
+_SW_G = (-2.273, 0.459)
+
+
+def _poly(coeffs, x):
+    result = 0.0
+    for c in reversed(coeffs):
+        result = result * x + c
+    return result
+
+
+@functools.lru_cache(maxsize=512)
+def _shapiro_coeffs(n):
+    """
+    Shapiro-Wilk coefficients for a sorted sample of size n (n >= 3)
+
+    Returns the full antisymmetric, unit-norm weight vector as a
+    read-only ndarray so W is a single dot product.
+    """
+    half = n // 2
+
+    if n == 3:
+        a = np.array([math.sqrt(0.5)])
+    else:
+        m = -special.ndtri((np.arange(1, half + 1) - 0.375) / (n + 0.25))
+        summ2 = 2.0 * np.dot(m, m)
+        ssumm2 = math.sqrt(summ2)
+        rsn = 1.0 / math.sqrt(n)
+
+        a = m / ssumm2
+        a1 = _poly(_SW_C1, rsn) + m[0] / ssumm2
+
+        if n > 5:
+            a2 = _poly(_SW_C2, rsn) + m[1] / ssumm2
+            fac = math.sqrt((summ2 - 2.0 * m[0] ** 2 - 2.0 * m[1] ** 2)
+                            / (1.0 - 2.0 * a1 ** 2 - 2.0 * a2 ** 2))
+            a = m / fac
+            a[1] = a2
+        else:
+            fac = math.sqrt((summ2 - 2.0 * m[0] ** 2) / (1.0 - 2.0 * a1 ** 2))
+            a = m / fac
+        a[0] = a1
+
+    weights = np.zeros(n)
+    weights[:half] = -a
+    weights[n - half:] = a[::-1]
+    weights.setflags(write=False)
+    return weights
+
+
+def _shapiro_pvalue(w, n):
+    if n == 3:
+        p_value = 6.0 / math.pi * (math.asin(math.sqrt(w)) - math.asin(math.sqrt(0.75)))
+        return max(p_value, 0.0)
+
+    # W is clipped to 1 for a sample that fits the weights exactly
+    if w >= 1.0:
+        return 1.0
+
+    y = math.log(1.0 - w)
+
+    if n <= 11:
+        gamma = _poly(_SW_G, n)
+        if y >= gamma:
+            return 1e-99
+        y = -math.log(gamma - y)
+        m = _poly(_SW_C3, n)
+        s = math.exp(_poly(_SW_C4, n))
+    else:
+        log_n = math.log(n)
+        m = _poly(_SW_C5, log_n)
+        s = math.exp(_poly(_SW_C6, log_n))
+
+    # Upper tail of the standard normal
+    return 0.5 * math.erfc((y - m) / s / SQRT2)
+
+
+def shapiro_wilk(data):
+    """
+    Shapiro-Wilk test for normality (Royston's AS R94 algorithm)
+
+    Equivalent to stats.shapiro(data). The order-statistic coefficients
+    depend only on the sample size and are cached per n, so repeated
+    calls cost one sort and two dot products.
+
+    Args:
+        data: Sample data (array-like, 3 <= n <= 5000)
+
+    Returns:
+        Tuple of (statistic, p_value)
+    """
+    sorted_data = np.sort(np.asarray(data, dtype=np.float64))
+    n = sorted_data.shape[0]
+
+    centered = sorted_data - sorted_data.mean()
+    ssq = np.dot(centered, centered)
+
+    if n < 3 or not ssq > 0:
+        statistic, p_value = stats.shapiro(sorted_data)
+        return float(statistic), float(p_value)
+
+    w = min(np.dot(_shapiro_coeffs(n), centered) ** 2 / ssq, 1.0)
+    return float(w), float(_shapiro_pvalue(w, n))
@@ -5,11 +5,19 @@ Perform Kolmogorov-Smirnov test
 
 import sys
 import json
-import argparse
 import numpy as np
 from scipy import stats
 
-def ks_test(data, distribution='normal', params=None):
+import kernels
+import cli
+import serialization
+
+# Distributions resolved once instead of by name on every kstest call
+_DISTS = {
+    'zipf': stats.zipf,
+}
+
+def ks_test(data, distribution='normal', params=None, dtype='float64'):
     """
     Perform Kolmogorov-Smirnov test for distribution fit.
 
@@ -17,22 +25,31 @@ def ks_test(data, distribution='normal', params=None):
         data: Sample data
         distribution: Distribution type ('normal' or 'zipf')
         params: Distribution parameters
+        dtype: Working precision, 'float64' (default) or 'float32'; float32
+               keeps float32 samples without a widening copy
 
     Returns:
         dict with statistic and pvalue
     """
-    data = np.array(data)
+    if dtype not in ('float64', 'float32'):
+        raise ValueError(f"Unsupported dtype: {dtype}")
+
+    data = np.asarray(data, dtype=dtype)
 
     if params is None:
         params = {}
 
     if distribution == 'normal':
-        mean = params.get('mean', np.mean(data))
-        std = params.get('std', np.std(data))
-        statistic, pvalue = stats.kstest(data, 'norm', args=(mean, std))
+        if 'mean' in params and 'std' in params:
+            mean, std = params['mean'], params['std']
+        else:
+            sample_mean, sample_std = kernels.mean_std(data)
+            mean = params.get('mean', sample_mean)
+            std = params.get('std', sample_std)
+        statistic, pvalue = kernels.ks_norm(data, mean, std)
     elif distribution == 'zipf':
         a = params.get('a', 1.5)
-        statistic, pvalue = stats.kstest(data, 'zipf', args=(a,))
+        statistic, pvalue = stats.kstest(data, _DISTS['zipf'].cdf, args=(a,))
     else:
         raise ValueError(f"Unsupported distribution: {distribution}")
 
@@ -41,19 +58,48 @@ def ks_test(data, distribution='normal', params=None):
         'pvalue': float(pvalue)
     }
 
-def main():
-    parser = argparse.ArgumentParser(description='Perform KS test')
-    parser.add_argument('--data', type=str, required=True, help='Sample data (JSON array)')
-    parser.add_argument('--distribution', type=str, default='normal', help='Distribution type')
-    parser.add_argument('--params', type=str, help='Distribution parameters (JSON object)')
+def run(args):
+    """
+    Handle a KS test request.
+
+    Args:
+        args: dict with 'data' and optional 'distribution', 'params', 'dtype'
 
-    args = parser.parse_args()
+    Returns:
+        dict with statistic and pvalue
+    """
+    return ks_test(
+        args['data'],
+        args.get('distribution', 'normal'),
+        args.get('params'),
+        args.get('dtype', 'float64')
+    )
 
+def main():
     try:
-        data = json.loads(args.data)
-        params = json.loads(args.params) if args.params else None
+        # --data: JSON array; --binary: read --n (default: all) raw values
+        # of --dtype from stdin; --params: JSON object
+        args = cli.parse_args(sys.argv[1:], {
+            'data': (str, None),
+            'n': (int, -1),
+            'distribution': (str, 'normal'),
+            'params': (str, None),
+            'dtype': (str, 'float64')
+        }, flags=('binary',))
+
+        if args['binary']:
+            data = serialization.read_binary(args['n'], dtype=args['dtype'])
+        elif args['data'] is not None:
+            data = serialization.loads(args['data'])
+        else:
+            raise ValueError('One of --data or --binary is required')
 
-        result = ks_test(data, args.distribution, params)
+        result = run({
+            'data': data,
+            'distribution': args['distribution'],
+            'params': serialization.loads(args['params']) if args['params'] else None,
+            'dtype': args['dtype']
+        })
         print(json.dumps(result))
         sys.exit(0)
     except Exception as e:
@@ -5,12 +5,19 @@ Generate values following Normal (Gaussian) distribution
 
 import sys
 import json
-import argparse
 import numpy as np
 
-def generate_normal(n, mean=0, std=1, seed=None):
+import cli
+import serialization
+
+_rng = np.random.default_rng()
+
+# Precisions Generator.standard_normal can draw in directly
+_DTYPES = ('float64', 'float32')
+
+def generate_normal_ndarray(n, mean=0, std=1, seed=None, dtype='float64'):
     """
-    Generate n values following Normal distribution.
+    Generate n values following Normal distribution as a numpy array.
 
     Normal distribution is commonly used for modeling:
     - Human heights, weights
@@ -23,38 +30,79 @@ def generate_normal(n, mean=0, std=1, seed=None):
         mean: Mean of the distribution (default 0)
         std: Standard deviation (default 1)
         seed: Random seed for reproducibility
+        dtype: 'float64' (default) or 'float32'; float32 halves memory and
+               output size, but draws a different sequence for the same seed
 
     Returns:
-        List of floats following Normal distribution
+        ndarray of the requested dtype following Normal distribution
     """
+    global _rng
+
     if seed is not None:
-        np.random.seed(seed)
+        _rng = np.random.default_rng(seed)
 
     if std <= 0:
         raise ValueError("Standard deviation must be positive")
 
-    values = np.random.normal(mean, std, n).tolist()
+    dtype = np.dtype(dtype)
+    if dtype.name not in _DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype.name}")
+
+    values = _rng.standard_normal(n, dtype=dtype)
+    np.multiply(values, dtype.type(std), out=values)
+    np.add(values, dtype.type(mean), out=values)
     return values
 
-def main():
-    parser = argparse.ArgumentParser(description='Generate Normal distributed values')
-    parser.add_argument('--n', type=int, required=True, help='Number of values')
-    parser.add_argument('--mean', type=float, default=0, help='Mean (default: 0)')
-    parser.add_argument('--std', type=float, default=1, help='Standard deviation (default: 1)')
-    parser.add_argument('--seed', type=int, help='Random seed')
+def generate_normal(n, mean=0, std=1, seed=None, dtype='float64'):
+    """
+    Generate n values following Normal distribution.
 
-    args = parser.parse_args()
+    Same as generate_normal_ndarray, returned as a list. Prefer the
+    ndarray version when the values feed numpy code.
 
+    Returns:
+        List of floats following Normal distribution
+    """
+    return generate_normal_ndarray(n, mean, std, seed, dtype).tolist()
+
+def run(args):
+    """
+    Handle a generation request.
+
+    Args:
+        args: dict with 'n' and optional 'mean', 'std', 'seed', 'dtype'
+
+    Returns:
+        dict with generated values and the parameters used
+    """
+    n = args['n']
+    mean = args.get('mean', 0)
+    std = args.get('std', 1)
+    seed = args.get('seed')
+    dtype = args.get('dtype', 'float64')
+
+    values = generate_normal_ndarray(n, mean, std, seed, dtype)
+    return {
+        'values': values,
+        'n': n,
+        'mean': mean,
+        'std': std,
+        'seed': seed,
+        'dtype': dtype
+    }
+
+def main():
     try:
-        values = generate_normal(args.n, args.mean, args.std, args.seed)
-        result = {
-            'values': values,
-            'n': args.n,
-            'mean': args.mean,
-            'std': args.std,
-            'seed': args.seed
-        }
-        print(json.dumps(result))
+        args = cli.parse_args(sys.argv[1:], {
+            'n': (int, None),
+            'mean': (float, 0),
+            'std': (float, 1),
+            'seed': (int, None),
+            'dtype': (str, 'float64')
+        }, required=('n',))
+
+        result = run(args)
+        serialization.write(result)
         sys.exit(0)
     except Exception as e:
         error = {
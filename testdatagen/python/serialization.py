@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Input/output helpers: JSON that understands numpy arrays, and raw
+float64 input for large samples
+"""
+
+import sys
+import json
+import math
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _finite(obj):
+    """
+    Convert numpy values to Python ones and non-finite floats to None.
+
+    The stdlib encoder writes NaN/Infinity, which is not valid JSON;
+    orjson writes null, and the fallback must match it. float32 values
+    go through their shortest float32 repr, as orjson writes them, instead
+    of widening to float64 (0.1 rather than 0.10000000149011612).
+    """
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    if isinstance(obj, (np.ndarray, np.generic)):
+        if obj.dtype == np.float32:
+            obj = np.asarray(obj).astype(str).astype(np.float64)
+        return _finite(obj.tolist())
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
+
+def loads(data):
+    """
+    Parse a JSON document (str or bytes), using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj):
+    """
+    Serialize obj to JSON.
+
+    Uses orjson when installed, which encodes numpy arrays directly
+    instead of going through a list of Python floats. Non-finite floats
+    are written as null either way.
+
+    Args:
+        obj: Object to serialize (may contain numpy arrays and scalars)
+
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(_finite(obj), allow_nan=False).encode('utf-8')
+
+def write(obj, stream=None):
+    """
+    Write obj as one line of JSON to a binary stream (default: stdout).
+    """
+    if stream is None:
+        stream = sys.stdout.buffer
+    stream.write(dumps(obj) + b'\n')
+    stream.flush()
+
+def read_binary(count=-1, stream=None, dtype=np.float64):
+    """
+    Read a raw native-endian float array from a binary stream (default: stdin).
+
+    Avoids building a Python float per element as JSON parsing does.
+
+    Args:
+        count: Number of values to read (default: everything in the stream)
+        stream: Binary stream to read from
+        dtype: Element type of the input (default: float64)
+
+    Returns:
+        Read-only numpy array of dtype
+    """
+    if stream is None:
+        stream = sys.stdin.buffer
+    return np.frombuffer(stream.read(), dtype=dtype, count=count)
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Build the optional compiled kernels in place:
+
+    python setup.py build_ext --inplace
+
+Requires Cython and a C compiler. The statistical tests fall back to
+numba or numpy when the extension is not built.
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    name='testdatagen-kernels',
+    ext_modules=cythonize(
+        [Extension('_ks_core', ['_ks_core.pyx'])],
+        language_level=3,
+    ),
+)
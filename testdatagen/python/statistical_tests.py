@@ -4,24 +4,66 @@ Statistical validation tests for generated data
 """
 import sys
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from scipy import stats
 import numpy as np
 
+import kernels
+import serialization
+
+# Distributions supported by ks_test, resolved once instead of by name per call
+_DISTS = {
+    'norm': stats.norm,
+    'uniform': stats.uniform,
+    'expon': stats.expon,
+}
+
+# uniformity_test runs its KS and chi-squared halves concurrently above this size;
+# below it the thread hand-off costs more than the overlap saves
+_PARALLEL_MIN_SIZE = 10000
+
+_POOL = None
+
+
+def _pool():
+    global _POOL
+
+    if _POOL is None:
+        _POOL = ThreadPoolExecutor(max_workers=2)
+
+    return _POOL
+
+
+# _hist_uniform bins its input in blocks of this size through per-thread
+# work buffers, so no temporaries scale with n
+_SCRATCH = threading.local()
+_SCRATCH_MAX_SIZE = 65536
+
+
+def _scratch(n):
+    if not hasattr(_SCRATCH, 'values'):
+        _SCRATCH.values = np.empty(_SCRATCH_MAX_SIZE)
+        _SCRATCH.indices = np.empty(_SCRATCH_MAX_SIZE, dtype=np.intp)
+        _SCRATCH.mask = np.empty(_SCRATCH_MAX_SIZE, dtype=bool)
+
+    return _SCRATCH.values[:n], _SCRATCH.indices[:n], _SCRATCH.mask[:n]
+
 
 def chi_squared_test(observed_freq, expected_freq):
     """
     Perform Chi-squared goodness of fit test
 
     Args:
-        observed_freq: List of observed frequencies
-        expected_freq: List of expected frequencies
+        observed_freq: List or ndarray of observed frequencies
+        expected_freq: List or ndarray of expected frequencies
 
     Returns:
         Dictionary with test statistic, p-value, and result
     """
     try:
-        observed = np.array(observed_freq)
-        expected = np.array(expected_freq)
+        observed = np.asarray(observed_freq, dtype=np.float64)
+        expected = np.asarray(expected_freq, dtype=np.float64)
 
         if len(observed) != len(expected):
             return {
@@ -29,19 +71,19 @@ def chi_squared_test(observed_freq, expected_freq):
                 'success': False
             }
 
-        if np.any(expected <= 0):
+        if not expected.min() > 0:
             return {
                 'error': 'Expected frequencies must be positive',
                 'success': False
             }
 
-        chi2_stat, p_value = stats.chisquare(observed, expected)
+        chi2_stat, p_value = kernels.chi_squared(observed, expected)
 
         return {
             'test': 'chi_squared',
             'statistic': float(chi2_stat),
             'p_value': float(p_value),
-            'significant': p_value < 0.05,
+            'significant': bool(p_value < 0.05),
             'degrees_of_freedom': len(observed) - 1,
             'success': True
         }
@@ -57,7 +99,7 @@ def ks_test(data, distribution='norm', params=None):
     Perform Kolmogorov-Smirnov test for distribution fit
 
     Args:
-        data: List of data values
+        data: List or ndarray of data values
         distribution: Distribution name ('norm', 'uniform', 'expon', etc.)
         params: Distribution parameters (mean, std for normal, etc.)
 
@@ -65,7 +107,7 @@ def ks_test(data, distribution='norm', params=None):
         Dictionary with test statistic, p-value, and result
     """
     try:
-        data_array = np.array(data)
+        data_array = np.asarray(data, dtype=np.float64)
 
         if len(data_array) < 2:
             return {
@@ -73,44 +115,146 @@ def ks_test(data, distribution='norm', params=None):
                 'success': False
             }
 
+        dist = _DISTS.get(distribution)
+
+        if dist is None:
+            return {
+                'error': f'Unsupported distribution: {distribution}',
+                'success': False
+            }
+
         if distribution == 'norm':
             if params:
                 mean = params.get('mean', 0)
                 std = params.get('std', 1)
-                ks_stat, p_value = stats.kstest(data_array, 'norm', args=(mean, std))
+                ks_stat, p_value = kernels.ks_norm(data_array, mean, std)
             else:
-                mean = np.mean(data_array)
-                std = np.std(data_array)
-                ks_stat, p_value = stats.kstest(data_array, 'norm', args=(mean, std))
+                mean, std = kernels.mean_std(data_array)
+                ks_stat, p_value = kernels.ks_norm(data_array, mean, std)
         elif distribution == 'uniform':
             if params:
                 loc = params.get('loc', 0)
                 scale = params.get('scale', 1)
-                ks_stat, p_value = stats.kstest(data_array, 'uniform', args=(loc, scale))
             else:
                 loc = np.min(data_array)
                 scale = np.max(data_array) - loc
-                ks_stat, p_value = stats.kstest(data_array, 'uniform', args=(loc, scale))
-        elif distribution == 'expon':
+            ks_stat, p_value = stats.kstest(data_array, dist.cdf, args=(loc, scale))
+        else:
             if params:
                 scale = params.get('scale', 1)
-                ks_stat, p_value = stats.kstest(data_array, 'expon', args=(0, scale))
             else:
                 scale = np.mean(data_array)
-                ks_stat, p_value = stats.kstest(data_array, 'expon', args=(0, scale))
-        else:
+            ks_stat, p_value = stats.kstest(data_array, dist.cdf, args=(0, scale))
+
+        return {
+            'test': 'kolmogorov_smirnov',
+            'distribution': distribution,
+            'statistic': float(ks_stat),
+            'p_value': float(p_value),
+            'significant': bool(p_value < 0.05),
+            'sample_size': len(data_array),
+            'success': True
+        }
+    except Exception as e:
+        return {
+            'error': str(e),
+            'success': False
+        }
+
+
+def _row_param(params, key, default, n_rows):
+    """
+    Read a distribution parameter given as a scalar or one value per row
+    """
+    value = np.asarray(params.get(key, default), dtype=np.float64)
+    return np.broadcast_to(value, (n_rows,))[:, None]
+
+
+def ks_test_batch(data, distribution='norm', params=None):
+    """
+    Perform Kolmogorov-Smirnov tests on many samples at once
+
+    Each row of data is tested independently against the distribution,
+    with the CDF and D statistic computed for all rows in one vectorized
+    pass; Normal rows are tested in parallel when numba is installed.
+
+    Args:
+        data: 2-D list/array of data values, one sample per row
+        distribution: Distribution name ('norm', 'uniform', 'expon')
+        params: Distribution parameters; each value is a scalar shared by
+                all rows or a list with one value per row. Estimated per
+                row when omitted.
+
+    Returns:
+        Dictionary with per-row test statistics, p-values, and results
+    """
+    try:
+        if isinstance(data, list) and len({len(row) for row in data if isinstance(row, list)}) > 1:
+            return {
+                'error': 'Samples must all have the same length',
+                'success': False
+            }
+
+        data_array = np.asarray(data, dtype=np.float64)
+
+        if data_array.ndim != 2:
+            return {
+                'error': 'Data must be a 2-D array with one sample per row',
+                'success': False
+            }
+
+        n_rows, n = data_array.shape
+
+        if n < 2:
+            return {
+                'error': 'Data must have at least 2 values',
+                'success': False
+            }
+
+        dist = _DISTS.get(distribution)
+
+        if dist is None:
             return {
                 'error': f'Unsupported distribution: {distribution}',
                 'success': False
             }
 
+        if distribution == 'norm':
+            if params:
+                mean = _row_param(params, 'mean', 0, n_rows)[:, 0]
+                std = _row_param(params, 'std', 1, n_rows)[:, 0]
+            else:
+                mean = std = None
+            ks_stats, p_values, _, _ = kernels.ks_norm_many(data_array, mean, std)
+        else:
+            sorted_data = np.sort(data_array, axis=1)
+
+            if distribution == 'uniform':
+                if params:
+                    loc = _row_param(params, 'loc', 0, n_rows)
+                    scale = _row_param(params, 'scale', 1, n_rows)
+                else:
+                    loc = sorted_data[:, :1]
+                    scale = sorted_data[:, -1:] - loc
+                cdf = dist.cdf(sorted_data, loc, scale)
+            else:
+                if params:
+                    scale = _row_param(params, 'scale', 1, n_rows)
+                else:
+                    scale = np.mean(data_array, axis=1, keepdims=True)
+                cdf = dist.cdf(sorted_data, 0, scale)
+
+            ks_stats = kernels.ks_statistic(cdf)
+            p_values = kernels.ks_pvalue(ks_stats, n)
+
         return {
             'test': 'kolmogorov_smirnov',
             'distribution': distribution,
-            'statistic': float(ks_stat),
-            'p_value': float(p_value),
-            'significant': p_value < 0.05,
-            'sample_size': len(data_array),
+            'statistic': ks_stats.tolist(),
+            'p_value': p_values.tolist(),
+            'significant': (p_values < 0.05).tolist(),
+            'sample_size': n,
+            'n_samples': n_rows,
             'success': True
         }
     except Exception as e:
@@ -125,14 +269,14 @@ def anderson_darling_test(data, distribution='norm'):
     Perform Anderson-Darling test for distribution fit
 
     Args:
-        data: List of data values
+        data: List or ndarray of data values
         distribution: Distribution name ('norm', 'expon', 'logistic', 'gumbel')
 
     Returns:
         Dictionary with test statistic, critical values, and result
     """
     try:
-        data_array = np.array(data)
+        data_array = np.asarray(data, dtype=np.float64)
 
         if len(data_array) < 2:
             return {
@@ -140,24 +284,27 @@ def anderson_darling_test(data, distribution='norm'):
                 'success': False
             }
 
-        result = stats.anderson(data_array, dist=distribution)
+        if distribution == 'norm':
+            statistic, critical_values = kernels.anderson_norm(data_array)
+        else:
+            result = stats.anderson(data_array, dist=distribution)
+            statistic, critical_values = result.statistic, result.critical_values
 
         significance_levels = [15, 10, 5, 2.5, 1]
-        rejected_at = None
 
-        for i, critical_value in enumerate(result.critical_values):
-            if result.statistic > critical_value:
-                rejected_at = significance_levels[i]
-            else:
-                break
+        # Critical values ascend as significance levels tighten, so the number
+        # of values below the statistic indexes the strictest rejected level
+        # (a NaN statistic exceeds none)
+        exceeded = int(np.count_nonzero(statistic > np.asarray(critical_values)))
+        rejected_at = significance_levels[exceeded - 1] if exceeded > 0 else None
 
         return {
             'test': 'anderson_darling',
             'distribution': distribution,
-            'statistic': float(result.statistic),
+            'statistic': float(statistic),
             'critical_values': {
                 f'{sl}%': float(cv)
-                for sl, cv in zip(significance_levels, result.critical_values)
+                for sl, cv in zip(significance_levels, critical_values)
             },
             'rejected_at': rejected_at,
             'significant': rejected_at is not None,
@@ -176,13 +323,13 @@ def shapiro_wilk_test(data):
     Perform Shapiro-Wilk test for normality
 
     Args:
-        data: List of data values
+        data: List or ndarray of data values
 
     Returns:
         Dictionary with test statistic, p-value, and result
     """
     try:
-        data_array = np.array(data)
+        data_array = np.asarray(data, dtype=np.float64)
 
         if len(data_array) < 3:
             return {
@@ -196,13 +343,13 @@ def shapiro_wilk_test(data):
                 'success': False
             }
 
-        stat, p_value = stats.shapiro(data_array)
+        stat, p_value = kernels.shapiro_wilk(data_array)
 
         return {
             'test': 'shapiro_wilk',
             'statistic': float(stat),
             'p_value': float(p_value),
-            'significant': p_value < 0.05,
+            'significant': bool(p_value < 0.05),
             'sample_size': len(data_array),
             'success': True
         }
@@ -213,25 +360,109 @@ def shapiro_wilk_test(data):
         }
 
 
+def _hist_uniform(data, n_bins):
+    """
+    Equal-width histogram over the data range, counts identical to np.histogram
+
+    Bins by direct index arithmetic into reused per-thread buffers and
+    counts with np.bincount, skipping np.histogram's generic setup. Large
+    inputs are processed in _SCRATCH_MAX_SIZE blocks.
+
+    Args:
+        data: 1-D float64 ndarray
+        n_bins: Number of bins
+
+    Returns:
+        ndarray of bin counts
+    """
+    lo = data.min()
+    hi = data.max()
+    span = hi - lo
+
+    if not 0 < span < np.inf:
+        return np.histogram(data, bins=n_bins)[0]
+
+    edges = np.linspace(lo, hi, n_bins + 1)
+    # Upper edge per bin; the last bin is closed, so nothing moves past it
+    upper = np.append(edges[1:-1], np.inf)
+    counts = np.zeros(n_bins, dtype=np.intp)
+
+    for start in range(0, data.shape[0], _SCRATCH_MAX_SIZE):
+        block = data[start:start + _SCRATCH_MAX_SIZE]
+        scaled, indices, mask = _scratch(block.shape[0])
+
+        np.subtract(block, lo, out=scaled)
+        np.multiply(scaled, n_bins / span, out=scaled)
+        np.copyto(indices, scaled, casting='unsafe')
+        np.minimum(indices, n_bins - 1, out=indices)
+
+        # Same rounding corrections np.histogram applies at the bin edges
+        np.take(edges, indices, out=scaled)
+        np.less(block, scaled, out=mask)
+        indices -= mask
+
+        np.take(upper, indices, out=scaled)
+        np.greater_equal(block, scaled, out=mask)
+        indices += mask
+
+        counts += np.bincount(indices, minlength=n_bins)
+
+    return counts
+
+
+def _chi_squared_arr(observed, expected, df):
+    """
+    Chi-squared test of observed counts against a constant expected count
+
+    Args:
+        observed: ndarray of observed frequencies
+        expected: Expected frequency of every bin (scalar)
+        df: Degrees of freedom
+
+    Returns:
+        Dictionary in the same shape as chi_squared_test
+    """
+    diff = observed - expected
+    chi2_stat = kernels.dot(diff, diff) / expected
+    p_value = float(stats.distributions.chi2.sf(chi2_stat, df))
+
+    return {
+        'test': 'chi_squared',
+        'statistic': chi2_stat,
+        'p_value': p_value,
+        'significant': bool(p_value < 0.05),
+        'degrees_of_freedom': df,
+        'success': True
+    }
+
+
 def uniformity_test(data):
     """
     Test if data follows uniform distribution using multiple methods
 
     Args:
-        data: List of data values
+        data: List or ndarray of data values
 
     Returns:
         Dictionary with results from multiple tests
     """
     try:
-        data_array = np.array(data)
+        data_array = np.asarray(data, dtype=np.float64)
 
-        ks_result = ks_test(data, 'uniform')
+        # Both halves spend their time in numpy/scipy C code with the GIL
+        # released, so the KS sort overlaps with the histogram pass
+        if len(data_array) >= _PARALLEL_MIN_SIZE:
+            ks_future = _pool().submit(ks_test, data_array, 'uniform')
+        else:
+            ks_future = None
+            ks_result = ks_test(data_array, 'uniform')
 
         n_bins = min(10, int(np.sqrt(len(data_array))))
-        hist, _ = np.histogram(data_array, bins=n_bins)
-        expected = np.full(n_bins, len(data_array) / n_bins)
-        chi2_result = chi_squared_test(hist.tolist(), expected.tolist())
+        hist = _hist_uniform(data_array, n_bins)
+        chi2_result = _chi_squared_arr(hist, len(data_array) / n_bins, n_bins - 1)
+
+        if ks_future is not None:
+            ks_result = ks_future.result()
 
         return {
             'ks_test': ks_result,
@@ -246,6 +477,61 @@ def uniformity_test(data):
         }
 
 
+def run(test_type, args):
+    """
+    Dispatch a statistical test request
+
+    Args:
+        test_type: Test name ('chi_squared', 'ks_test', 'ks_test_batch', 'anderson',
+                   'shapiro', 'uniformity')
+        args: Dictionary of test arguments
+
+    Returns:
+        Dictionary with the test result
+    """
+    if test_type == 'chi_squared':
+        return chi_squared_test(args['observed'], args['expected'])
+    elif test_type == 'ks_test':
+        return ks_test(args['data'], args.get('distribution', 'norm'), args.get('params'))
+    elif test_type == 'ks_test_batch':
+        return ks_test_batch(args['data'], args.get('distribution', 'norm'), args.get('params'))
+    elif test_type == 'anderson':
+        return anderson_darling_test(args['data'], args.get('distribution', 'norm'))
+    elif test_type == 'shapiro':
+        return shapiro_wilk_test(args['data'])
+    elif test_type == 'uniformity':
+        return uniformity_test(args['data'])
+    else:
+        return {'error': f'Unknown test type: {test_type}', 'success': False}
+
+
+def _data_arg(value):
+    """
+    Parse a data argument: a JSON array, or '--binary' to read raw float64 from stdin
+    """
+    if value == '--binary':
+        return serialization.read_binary()
+    return serialization.loads(value)
+
+
+def _batch_data_arg(value):
+    """
+    Parse ks_test_batch data: a 2-D JSON array, or '--binary=<rows>' to read
+    raw float64 from stdin as that many equal-length rows
+    """
+    if value == '--binary':
+        raise ValueError('ks_test_batch reads binary input as --binary=<rows>')
+
+    if value.startswith('--binary='):
+        n_rows = int(value[len('--binary='):])
+        values = serialization.read_binary()
+        if n_rows < 1 or len(values) % n_rows:
+            raise ValueError(f'Binary input of {len(values)} values does not split into {n_rows} equal rows')
+        return values.reshape(n_rows, -1)
+
+    return serialization.loads(value)
+
+
 def main():
     if len(sys.argv) < 2:
         print(json.dumps({'error': 'No test specified', 'success': False}))
@@ -255,28 +541,34 @@ def main():
 
     try:
         if test_type == 'chi_squared':
-            observed = json.loads(sys.argv[2])
-            expected = json.loads(sys.argv[3])
-            result = chi_squared_test(observed, expected)
-        elif test_type == 'ks_test':
-            data = json.loads(sys.argv[2])
-            distribution = sys.argv[3] if len(sys.argv) > 3 else 'norm'
-            params = json.loads(sys.argv[4]) if len(sys.argv) > 4 else None
-            result = ks_test(data, distribution, params)
-        elif test_type == 'anderson':
-            data = json.loads(sys.argv[2])
-            distribution = sys.argv[3] if len(sys.argv) > 3 else 'norm'
-            result = anderson_darling_test(data, distribution)
-        elif test_type == 'shapiro':
-            data = json.loads(sys.argv[2])
-            result = shapiro_wilk_test(data)
-        elif test_type == 'uniformity':
-            data = json.loads(sys.argv[2])
-            result = uniformity_test(data)
+            if sys.argv[2] == '--binary':
+                values = serialization.read_binary()
+                if len(values) % 2:
+                    raise ValueError('Binary input must hold observed and expected arrays of equal length')
+                observed, expected = np.split(values, 2)
+            else:
+                observed = serialization.loads(sys.argv[2])
+                expected = serialization.loads(sys.argv[3])
+            args = {
+                'observed': observed,
+                'expected': expected
+            }
+        elif test_type in ('ks_test', 'ks_test_batch', 'anderson'):
+            parse_data = _batch_data_arg if test_type == 'ks_test_batch' else _data_arg
+            args = {
+                'data': parse_data(sys.argv[2]),
+                'distribution': sys.argv[3] if len(sys.argv) > 3 else 'norm'
+            }
+            if test_type != 'anderson':
+                args['params'] = serialization.loads(sys.argv[4]) if len(sys.argv) > 4 else None
+        elif test_type in ('shapiro', 'uniformity'):
+            args = {'data': _data_arg(sys.argv[2])}
         else:
-            result = {'error': f'Unknown test type: {test_type}', 'success': False}
+            args = {}
+
+        result = run(test_type, args)
 
-        print(json.dumps(result))
+        serialization.write(result)
     except Exception as e:
         print(json.dumps({'error': str(e), 'success': False}))
         sys.exit(1)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Long-lived worker serving distribution and statistical test requests
+
+Reads one JSON request per line from stdin and writes one JSON response
+per line to stdout, so numpy/scipy are imported once per process instead
+of once per call:
+
+    request:  {"id": 1, "op": "generate_normal", "args": {"n": 10}}
+    response: {"id": 1, "ok": true, "result": {...}}
+    failure:  {"id": 1, "ok": false, "error": "...", "type": "ValueError"}
+
+Run with `python -u worker.py`. The worker needs numpy and scipy to
+start, so dependency checks run as check_dependencies.py instead.
+"""
+
+import sys
+
+import chi_squared_test
+import ks_test
+import normal_distribution
+import serialization
+import statistical_tests
+import zipf_distribution
+
+
+def _statistical_test(test_type):
+    return lambda args: statistical_tests.run(test_type, args)
+
+
+_OPS = {
+    'generate_normal': normal_distribution.run,
+    'generate_zipf': zipf_distribution.run,
+    'chi_squared_test': chi_squared_test.run,
+    'ks_test': ks_test.run,
+    'statistical_tests.chi_squared': _statistical_test('chi_squared'),
+    'statistical_tests.ks_test': _statistical_test('ks_test'),
+    'statistical_tests.ks_test_batch': _statistical_test('ks_test_batch'),
+    'statistical_tests.anderson': _statistical_test('anderson'),
+    'statistical_tests.shapiro': _statistical_test('shapiro'),
+    'statistical_tests.uniformity': _statistical_test('uniformity'),
+}
+
+
+def dispatch(op, args):
+    """
+    Run a single operation
+
+    Args:
+        op: Operation name (see _OPS)
+        args: Dictionary of operation arguments
+
+    Returns:
+        Dictionary with the operation result
+    """
+    handler = _OPS.get(op)
+
+    if handler is None:
+        raise ValueError(f'Unknown operation: {op}')
+
+    return handler(args or {})
+
+
+def handle(line):
+    """
+    Decode a request line, run it, and encode the response
+
+    Args:
+        line: Raw JSON request line
+
+    Returns:
+        JSON-encoded response as bytes (without trailing newline)
+    """
+    request_id = None
+
+    try:
+        request = serialization.loads(line)
+        request_id = request.get('id')
+        result = dispatch(request['op'], request.get('args'))
+        return serialization.dumps({'id': request_id, 'ok': True, 'result': result})
+    except Exception as e:
+        return serialization.dumps({
+            'id': request_id,
+            'ok': False,
+            'error': str(e),
+            'type': type(e).__name__
+        })
+
+
+def main():
+    while True:
+        line = sys.stdin.readline()
+
+        if not line:
+            break
+
+        if not line.strip():
+            continue
+
+        sys.stdout.buffer.write(handle(line) + b'\n')
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -5,12 +5,59 @@ Generate values following Zipf distribution
 
 import sys
 import json
-import argparse
 import numpy as np
+from numpy.random import Generator, PCG64DXSM
 
-def generate_zipf(n, a=1.5, seed=None):
+import cli
+import serialization
+
+_rng = Generator(PCG64DXSM())
+
+# Samples at or above 2**63 do not fit the int64 output and are rejected
+_MAX_SAMPLE = 2.0 ** 63
+
+_DTYPES = ('int64', 'int32')
+
+# Below this many samples numpy's per-sample Generator.zipf is faster than
+# the vectorized rejection rounds, whose fixed per-round cost dominates
+_VECTORIZED_MIN_N = 2048
+
+def _zipf_rejection(rng, a, n, dtype=np.int64):
     """
-    Generate n values following Zipf distribution with parameter a.
+    Draw n Zipf(a) samples with Devroye's rejection method, vectorized.
+
+    Same algorithm numpy's Generator.zipf runs per sample, but each round
+    proposes every outstanding sample at once from two bulk uniform draws,
+    so the per-sample loop overhead is gone. Roughly 2x faster for large
+    n, but slower below _VECTORIZED_MIN_N samples. Raises ValueError if a sample does not fit in dtype.
+    """
+    am1 = a - 1.0
+    b = 2.0 ** am1
+
+    values = np.empty(n, dtype=dtype)
+    limit = np.iinfo(values.dtype).max
+    pending = np.arange(n)
+
+    while pending.size:
+        u = 1.0 - rng.random(pending.size)
+        v = rng.random(pending.size)
+
+        x = np.floor(u ** (-1.0 / am1))
+        t = (1.0 + 1.0 / x) ** am1
+        accepted = (x < _MAX_SAMPLE) & (v * x * (t - 1.0) / (b - 1.0) <= t / b)
+
+        samples = x[accepted]
+        if limit < _MAX_SAMPLE and samples.size and samples.max() > limit:
+            raise ValueError(f"Zipf sample {int(samples.max())} does not fit in {values.dtype}; use int64")
+
+        values[pending[accepted]] = samples
+        pending = pending[~accepted]
+
+    return values
+
+def generate_zipf_ndarray(n, a=1.5, seed=None, dtype='int64'):
+    """
+    Generate n values following Zipf distribution with parameter a as a numpy array.
 
     Zipf distribution is commonly used for modeling:
     - Product popularity (80/20 rule)
@@ -19,38 +66,87 @@ def generate_zipf(n, a=1.5, seed=None):
 
     Args:
         n: Number of values to generate
-        a: Distribution parameter (default 1.5)
-           a > 1: more skewed (fewer items get most selections)
-           a = 1: harmonic series
-           a < 1: less skewed
+        a: Distribution parameter, must be > 1 (default 1.5)
+           larger a: more skewed (fewer items get most selections)
         seed: Random seed for reproducibility
+        dtype: 'int64' (default) or 'int32'; int32 halves memory, and the
+               same seed yields the same values, but heavy tails (a close
+               to 1) can produce samples above 2**31 - 1, which raise
 
     Returns:
-        List of integers following Zipf distribution
+        ndarray of the requested dtype following Zipf distribution
     """
+    global _rng
+
     if seed is not None:
-        np.random.seed(seed)
+        _rng = Generator(PCG64DXSM(seed))
+
+    if a <= 1:
+        raise ValueError("Zipf parameter a must be greater than 1")
 
-    values = np.random.zipf(a, n).tolist()
+    dtype = np.dtype(dtype)
+    if dtype.name not in _DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype.name}")
+
+    if n >= _VECTORIZED_MIN_N:
+        return _zipf_rejection(_rng, a, n, dtype)
+
+    # The path depends only on n, so a seed still gives reproducible values
+    values = _rng.zipf(a, n)
+    if dtype != values.dtype:
+        limit = np.iinfo(dtype).max
+        if values.size and values.max() > limit:
+            raise ValueError(f"Zipf sample {int(values.max())} does not fit in {dtype}; use int64")
+        values = values.astype(dtype)
     return values
 
-def main():
-    parser = argparse.ArgumentParser(description='Generate Zipf distributed values')
-    parser.add_argument('--n', type=int, required=True, help='Number of values')
-    parser.add_argument('--a', type=float, default=1.5, help='Zipf parameter (default: 1.5)')
-    parser.add_argument('--seed', type=int, help='Random seed')
+def generate_zipf(n, a=1.5, seed=None, dtype='int64'):
+    """
+    Generate n values following Zipf distribution with parameter a.
+
+    Same as generate_zipf_ndarray, returned as a list. Prefer the
+    ndarray version when the values feed numpy code.
+
+    Returns:
+        List of integers following Zipf distribution
+    """
+    return generate_zipf_ndarray(n, a, seed, dtype).tolist()
 
-    args = parser.parse_args()
+def run(args):
+    """
+    Handle a generation request.
+
+    Args:
+        args: dict with 'n' and optional 'a', 'seed', 'dtype'
+
+    Returns:
+        dict with generated values and the parameters used
+    """
+    n = args['n']
+    a = args.get('a', 1.5)
+    seed = args.get('seed')
+    dtype = args.get('dtype', 'int64')
+
+    values = generate_zipf_ndarray(n, a, seed, dtype)
+    return {
+        'values': values,
+        'n': n,
+        'a': a,
+        'seed': seed,
+        'dtype': dtype
+    }
 
+def main():
     try:
-        values = generate_zipf(args.n, args.a, args.seed)
-        result = {
-            'values': values,
-            'n': args.n,
-            'a': args.a,
-            'seed': args.seed
-        }
-        print(json.dumps(result))
+        args = cli.parse_args(sys.argv[1:], {
+            'n': (int, None),
+            'a': (float, 1.5),
+            'seed': (int, None),
+            'dtype': (str, 'int64')
+        }, required=('n',))
+
+        result = run(args)
+        serialization.write(result)
         sys.exit(0)
     except Exception as e:
         error = {
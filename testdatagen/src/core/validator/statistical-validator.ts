@@ -1,5 +1,4 @@
-import { spawn } from 'child_process';
-import * as path from 'path';
+import { PythonWorker } from '../../utils/python-worker';
 
 export interface ChiSquaredResult {
   test: 'chi_squared';
@@ -18,6 +17,16 @@ export interface KSTestResult {
   sample_size: number;
 }
 
+export interface KSTestBatchResult {
+  test: 'kolmogorov_smirnov';
+  distribution: string;
+  statistic: number[];
+  p_value: number[];
+  significant: boolean[];
+  sample_size: number;
+  n_samples: number;
+}
+
 export interface AndersonDarlingResult {
   test: 'anderson_darling';
   distribution: string;
@@ -51,21 +60,15 @@ export type StatisticalTestResult =
 
 export class StatisticalValidator {
   private pythonPath: string;
-  private scriptPath: string;
+  private worker: PythonWorker;
 
   constructor(pythonPath: string = 'python3') {
     this.pythonPath = pythonPath;
-    this.scriptPath = path.join(__dirname, '../../../python/statistical_tests.py');
+    this.worker = new PythonWorker(pythonPath);
   }
 
   async chiSquaredTest(observed: number[], expected: number[]): Promise<ChiSquaredResult> {
-    const args = [
-      'chi_squared',
-      JSON.stringify(observed),
-      JSON.stringify(expected)
-    ];
-
-    const result = await this.runPythonScript(args);
+    const result = await this.runTest('chi_squared', { observed, expected });
 
     if (!result.success) {
       throw new Error(`Chi-squared test failed: ${result.error}`);
@@ -79,17 +82,7 @@ export class StatisticalValidator {
     distribution: 'norm' | 'uniform' | 'expon' = 'norm',
     params?: { mean?: number; std?: number; loc?: number; scale?: number }
   ): Promise<KSTestResult> {
-    const args = [
-      'ks_test',
-      JSON.stringify(data),
-      distribution
-    ];
-
-    if (params) {
-      args.push(JSON.stringify(params));
-    }
-
-    const result = await this.runPythonScript(args);
+    const result = await this.runTest('ks_test', { data, distribution, params });
 
     if (!result.success) {
       throw new Error(`K-S test failed: ${result.error}`);
@@ -98,17 +91,25 @@ export class StatisticalValidator {
     return result as KSTestResult;
   }
 
+  async ksTestBatch(
+    samples: number[][],
+    distribution: 'norm' | 'uniform' | 'expon' = 'norm',
+    params?: Record<string, number | number[]>
+  ): Promise<KSTestBatchResult> {
+    const result = await this.runTest('ks_test_batch', { data: samples, distribution, params });
+
+    if (!result.success) {
+      throw new Error(`K-S batch test failed: ${result.error}`);
+    }
+
+    return result as KSTestBatchResult;
+  }
+
   async andersonDarlingTest(
     data: number[],
     distribution: 'norm' | 'expon' | 'logistic' | 'gumbel' = 'norm'
   ): Promise<AndersonDarlingResult> {
-    const args = [
-      'anderson',
-      JSON.stringify(data),
-      distribution
-    ];
-
-    const result = await this.runPythonScript(args);
+    const result = await this.runTest('anderson', { data, distribution });
 
     if (!result.success) {
       throw new Error(`Anderson-Darling test failed: ${result.error}`);
@@ -118,12 +119,7 @@ export class StatisticalValidator {
   }
 
   async shapiroWilkTest(data: number[]): Promise<ShapiroWilkResult> {
-    const args = [
-      'shapiro',
-      JSON.stringify(data)
-    ];
-
-    const result = await this.runPythonScript(args);
+    const result = await this.runTest('shapiro', { data });
 
     if (!result.success) {
       throw new Error(`Shapiro-Wilk test failed: ${result.error}`);
@@ -133,12 +129,7 @@ export class StatisticalValidator {
   }
 
   async uniformityTest(data: number[]): Promise<UniformityTestResult> {
-    const args = [
-      'uniformity',
-      JSON.stringify(data)
-    ];
-
-    const result = await this.runPythonScript(args);
+    const result = await this.runTest('uniformity', { data });
 
     if (!result.success) {
       throw new Error(`Uniformity test failed: ${result.error}`);
@@ -248,43 +239,13 @@ export class StatisticalValidator {
     return this.chiSquaredTest(observedFreq, expectedFreq);
   }
 
-  private async runPythonScript(args: string[]): Promise<any> {
-    return new Promise((resolve, reject) => {
-      const process = spawn(this.pythonPath, [this.scriptPath, ...args]);
-
-      let stdout = '';
-      let stderr = '';
-
-      process.stdout.on('data', (data) => {
-        stdout += data.toString();
-      });
-
-      process.stderr.on('data', (data) => {
-        stderr += data.toString();
-      });
-
-      process.on('close', (code) => {
-        if (code !== 0) {
-          reject(new Error(`Python process exited with code ${code}: ${stderr}`));
-          return;
-        }
-
-        try {
-          const result = JSON.parse(stdout);
-          resolve(result);
-        } catch (error) {
-          reject(new Error(`Failed to parse Python output: ${stdout}`));
-        }
-      });
-
-      process.on('error', (error) => {
-        reject(new Error(`Failed to spawn Python process: ${error.message}`));
-      });
-    });
+  private async runTest(testType: string, args: Record<string, any>): Promise<any> {
+    return this.worker.request(`statistical_tests.${testType}`, args);
   }
 
   setPythonPath(pythonPath: string): void {
     this.pythonPath = pythonPath;
+    this.worker.setPythonExecutable(pythonPath);
   }
 
   getPythonPath(): string {
@@ -293,10 +254,14 @@ export class StatisticalValidator {
 
   async isPythonAvailable(): Promise<boolean> {
     try {
-      await this.runPythonScript(['chi_squared', '[1, 2, 3]', '[1, 2, 3]']);
+      await this.runTest('chi_squared', { observed: [1, 2, 3], expected: [1, 2, 3] });
       return true;
     } catch {
       return false;
     }
   }
+
+  close(): void {
+    this.worker.close();
+  }
 }
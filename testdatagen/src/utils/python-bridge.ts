@@ -1,5 +1,6 @@
 import { spawn, SpawnOptionsWithoutStdio } from 'child_process';
 import * as path from 'path';
+import { PythonWorker } from './python-worker';
 
 export interface PythonResult {
   success: boolean;
@@ -11,10 +12,12 @@ export interface PythonResult {
 export class PythonBridge {
   private pythonExecutable: string;
   private scriptsPath: string;
+  private worker: PythonWorker;
 
   constructor(pythonExecutable: string = 'python3') {
     this.pythonExecutable = pythonExecutable;
     this.scriptsPath = path.join(__dirname, '../../python');
+    this.worker = new PythonWorker(pythonExecutable);
   }
 
   /**
@@ -80,6 +83,31 @@ export class PythonBridge {
     });
   }
 
+  /**
+   * Run an operation on the persistent Python worker
+   */
+  public async request(op: string, args: Record<string, any> = {}): Promise<PythonResult> {
+    try {
+      const data = await this.worker.request(op, args);
+      return {
+        success: true,
+        data
+      };
+    } catch (error) {
+      return {
+        success: false,
+        error: error instanceof Error ? error.message : String(error)
+      };
+    }
+  }
+
+  /**
+   * Stop the persistent Python worker
+   */
+  public close(): void {
+    this.worker.close();
+  }
+
   /**
    * Check if Python is available
    */
@@ -103,6 +131,8 @@ export class PythonBridge {
    * Check if required Python packages are installed
    */
   public async checkDependencies(): Promise<{ available: boolean; missing: string[] }> {
+    // Runs as its own script: the worker imports numpy/scipy on start-up,
+    // so it cannot report which of them is missing
     const result = await this.execute('check_dependencies.py');
 
     if (!result.success) {
@@ -126,16 +156,7 @@ export class PythonBridge {
     a: number = 1.5,
     seed?: number
   ): Promise<number[]> {
-    const args = [
-      '--n', n.toString(),
-      '--a', a.toString()
-    ];
-
-    if (seed !== undefined) {
-      args.push('--seed', seed.toString());
-    }
-
-    const result = await this.execute('zipf_distribution.py', args);
+    const result = await this.request('generate_zipf', { n, a, seed });
 
     if (!result.success) {
       throw new Error(`Failed to generate Zipf distribution: ${result.error}`);
@@ -146,24 +167,18 @@ export class PythonBridge {
 
   /**
    * Generate values using Normal distribution
+   *
+   * float32 values serialize to roughly half the JSON of float64 ones,
+   * with or without orjson installed.
    */
   public async generateNormal(
     n: number,
     mean: number = 0,
     std: number = 1,
-    seed?: number
+    seed?: number,
+    dtype: 'float64' | 'float32' = 'float64'
   ): Promise<number[]> {
-    const args = [
-      '--n', n.toString(),
-      '--mean', mean.toString(),
-      '--std', std.toString()
-    ];
-
-    if (seed !== undefined) {
-      args.push('--seed', seed.toString());
-    }
-
-    const result = await this.execute('normal_distribution.py', args);
+    const result = await this.request('generate_normal', { n, mean, std, seed, dtype });
 
     if (!result.success) {
       throw new Error(`Failed to generate Normal distribution: ${result.error}`);
@@ -179,12 +194,7 @@ export class PythonBridge {
     observed: number[],
     expected: number[]
   ): Promise<{ statistic: number; pvalue: number; significant: boolean }> {
-    const args = [
-      '--observed', JSON.stringify(observed),
-      '--expected', JSON.stringify(expected)
-    ];
-
-    const result = await this.execute('chi_squared_test.py', args);
+    const result = await this.request('chi_squared_test', { observed, expected });
 
     if (!result.success) {
       throw new Error(`Failed to perform Chi-squared test: ${result.error}`);
@@ -201,16 +211,7 @@ export class PythonBridge {
     distribution: 'normal' | 'zipf' = 'normal',
     params?: { mean?: number; std?: number; a?: number }
   ): Promise<{ statistic: number; pvalue: number }> {
-    const args = [
-      '--data', JSON.stringify(data),
-      '--distribution', distribution
-    ];
-
-    if (params) {
-      args.push('--params', JSON.stringify(params));
-    }
-
-    const result = await this.execute('ks_test.py', args);
+    const result = await this.request('ks_test', { data, distribution, params });
 
     if (!result.success) {
       throw new Error(`Failed to perform KS test: ${result.error}`);
@@ -224,6 +225,7 @@ export class PythonBridge {
    */
   public setPythonExecutable(path: string): void {
     this.pythonExecutable = path;
+    this.worker.setPythonExecutable(path);
   }
 
   /**
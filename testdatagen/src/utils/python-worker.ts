@@ -0,0 +1,216 @@
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
+import * as path from 'path';
+
+interface PendingRequest {
+  resolve: (value: any) => void;
+  reject: (error: Error) => void;
+}
+
+// Only the end of the worker's stderr is kept for error messages
+const MAX_STDERR_LENGTH = 8192;
+
+interface WorkerResponse {
+  id: number | null;
+  ok: boolean;
+  result?: any;
+  error?: string;
+  type?: string;
+}
+
+/**
+ * Client for the long-lived Python worker (python/worker.py).
+ *
+ * Spawns a single Python process on first use and pipes newline-delimited
+ * JSON requests to it, so numpy/scipy are imported once rather than per call.
+ */
+export class PythonWorker {
+  private pythonExecutable: string;
+  private workerPath: string;
+  private process: ChildProcessWithoutNullStreams | null = null;
+  private pending = new Map<number, PendingRequest>();
+  private nextId = 1;
+  private buffer = '';
+  private stderr = '';
+
+  constructor(pythonExecutable: string = 'python3') {
+    this.pythonExecutable = pythonExecutable;
+    this.workerPath = path.join(__dirname, '../../python/worker.py');
+  }
+
+  /**
+   * Send a request to the worker and resolve with its result
+   */
+  public request(op: string, args: Record<string, any> = {}): Promise<any> {
+    return new Promise((resolve, reject) => {
+      let child: ChildProcessWithoutNullStreams;
+
+      try {
+        child = this.ensureStarted();
+      } catch (error) {
+        reject(new Error(`Failed to start Python worker: ${error}`));
+        return;
+      }
+
+      const id = this.nextId++;
+      this.pending.set(id, { resolve, reject });
+      this.setRef(true);
+
+      child.stdin.write(JSON.stringify({ id, op, args }) + '\n');
+    });
+  }
+
+  /**
+   * Stop the worker process; pending requests are rejected
+   */
+  public close(): void {
+    this.terminate(new Error('Python worker was closed'));
+  }
+
+  /**
+   * Set Python executable path (restarts the worker on next request)
+   */
+  public setPythonExecutable(pythonExecutable: string): void {
+    this.close();
+    this.pythonExecutable = pythonExecutable;
+  }
+
+  /**
+   * Get Python executable path
+   */
+  public getPythonExecutable(): string {
+    return this.pythonExecutable;
+  }
+
+  private ensureStarted(): ChildProcessWithoutNullStreams {
+    if (this.process) {
+      return this.process;
+    }
+
+    const child = spawn(this.pythonExecutable, ['-u', this.workerPath], {
+      cwd: path.dirname(this.workerPath)
+    });
+
+    // Decode as a stream so multi-byte UTF-8 characters split across
+    // chunks are not corrupted
+    child.stdout.setEncoding('utf8');
+    child.stderr.setEncoding('utf8');
+
+    child.stdout.on('data', (data: string) => {
+      this.onStdout(data);
+    });
+
+    child.stderr.on('data', (data: string) => {
+      this.stderr = (this.stderr + data).slice(-MAX_STDERR_LENGTH);
+    });
+
+    child.stdin.on('error', () => {
+      // Surfaced through the 'error'/'close' handlers below
+    });
+
+    child.on('error', (error) => {
+      if (this.process === child) {
+        this.reset(new Error(`Failed to start Python worker: ${error.message}`));
+      }
+    });
+
+    child.on('close', (code) => {
+      if (this.process === child) {
+        this.reset(new Error(`Python worker exited with code ${code}: ${this.stderr}`));
+      }
+    });
+
+    this.process = child;
+    this.buffer = '';
+    this.stderr = '';
+
+    return child;
+  }
+
+  private onStdout(chunk: string): void {
+    this.buffer += chunk;
+
+    let newline = this.buffer.indexOf('\n');
+    while (newline !== -1) {
+      const line = this.buffer.slice(0, newline);
+      this.buffer = this.buffer.slice(newline + 1);
+
+      if (line.trim()) {
+        this.onLine(line);
+      }
+
+      newline = this.buffer.indexOf('\n');
+    }
+  }
+
+  private onLine(line: string): void {
+    let response: WorkerResponse;
+
+    try {
+      response = JSON.parse(line);
+    } catch (error) {
+      // The stream can no longer be trusted to line up with requests
+      this.terminate(new Error(`Failed to parse Python worker output: ${line}`));
+      return;
+    }
+
+    const pending = response.id !== null ? this.pending.get(response.id) : undefined;
+    if (!pending) {
+      return;
+    }
+
+    this.pending.delete(response.id as number);
+
+    if (response.ok) {
+      pending.resolve(response.result);
+    } else {
+      pending.reject(new Error(`${response.type}: ${response.error}`));
+    }
+
+    if (this.pending.size === 0) {
+      this.setRef(false);
+    }
+  }
+
+  /**
+   * Keep the event loop alive only while requests are in flight, so an idle
+   * worker never prevents the parent process from exiting.
+   */
+  private setRef(ref: boolean): void {
+    if (!this.process) {
+      return;
+    }
+
+    const handles: any[] = [this.process, this.process.stdin, this.process.stdout, this.process.stderr];
+    for (const handle of handles) {
+      if (ref) {
+        handle.ref?.();
+      } else {
+        handle.unref?.();
+      }
+    }
+  }
+
+  /**
+   * Kill the worker process (if any) and reject pending requests
+   */
+  private terminate(error: Error): void {
+    if (this.process) {
+      this.setRef(false);
+      this.process.stdin.end();
+      this.process.kill();
+    }
+    this.reset(error);
+  }
+
+  private reset(error: Error): void {
+    this.process = null;
+    this.buffer = '';
+
+    const pending = Array.from(this.pending.values());
+    this.pending.clear();
+
+    for (const request of pending) {
+      request.reject(error);
+    }
+  }
+}
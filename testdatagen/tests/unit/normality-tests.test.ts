@@ -0,0 +1,107 @@
+import { PythonWorker } from '../../src/utils/python-worker';
+
+// Deterministic, roughly symmetric sample so results are reproducible
+const sample = (length: number): number[] =>
+  Array.from({ length }, (_, i) => Math.sin(i * 12.9898));
+
+describe('PythonWorker normality tests', () => {
+  let worker: PythonWorker;
+
+  beforeEach(() => {
+    worker = new PythonWorker();
+  });
+
+  afterEach(() => {
+    worker.close();
+  });
+
+  describe('shapiro', () => {
+    // scipy.stats.shapiro on sample(n); scipy's float32 Fortran routine
+    // agrees with the worker to about 1e-9
+    const expected: [number, number, number][] = [
+      [3, 0.9968818318410131, 0.893296883792489],
+      [8, 0.9274397853503877, 0.49307182978263525],
+      [20, 0.8961841978501358, 0.03499629309915139]
+    ];
+
+    it('matches scipy for small and large n', async () => {
+      for (const [n, statistic, pValue] of expected) {
+        const result = await worker.request('statistical_tests.shapiro', { data: sample(n) });
+
+        expect(result.success).toBe(true);
+        expect(result.sample_size).toBe(n);
+        expect(result.statistic).toBeCloseTo(statistic, 6);
+        expect(result.p_value).toBeCloseTo(pValue, 6);
+        expect(result.significant).toBe(pValue < 0.05);
+      }
+    });
+
+    it('clips W to 1 for a sample proportional to its coefficients', async () => {
+      // 3 * a + 1 for the n=4 coefficients a; rounding puts W just above 1
+      const data = [-1.061792857725413, 0.5009907697923067, 1.4990092302076934, 3.061792857725413];
+
+      const result = await worker.request('statistical_tests.shapiro', { data });
+
+      expect(result.statistic).toBe(1);
+      expect(result.p_value).toBe(1);
+    });
+
+    it('matches scipy for constant input', async () => {
+      const result = await worker.request('statistical_tests.shapiro', { data: [1, 1, 1, 1] });
+
+      expect(result.success).toBe(true);
+      expect(result.statistic).toBe(1);
+      expect(result.p_value).toBe(1);
+    });
+
+    it('returns null statistics for NaN input', async () => {
+      // NaN is sent as null, which the worker reads back as NaN
+      const result = await worker.request('statistical_tests.shapiro', { data: [1, NaN, 2, 3] });
+
+      expect(result.success).toBe(true);
+      expect(result.statistic).toBeNull();
+      expect(result.p_value).toBeNull();
+      expect(result.significant).toBe(false);
+    });
+  });
+
+  describe('anderson', () => {
+    // scipy.stats.anderson(sample(n), dist='norm'): statistic, critical
+    // values at 15%, 10%, 5%, 2.5% and 1%, and the strictest rejected level
+    const expected: [number, number, number[], number | null][] = [
+      [3, 0.1929659042483034, [0.374, 0.421, 0.501, 0.582, 0.69], null],
+      [8, 0.2661263782353682, [0.497, 0.559, 0.666, 0.773, 0.917], null],
+      [20, 0.6584240725912736, [0.538, 0.605, 0.721, 0.837, 0.992], 10]
+    ];
+
+    it('matches scipy for small and large n', async () => {
+      for (const [n, statistic, criticalValues, rejectedAt] of expected) {
+        const result = await worker.request('statistical_tests.anderson', { data: sample(n) });
+
+        expect(result.success).toBe(true);
+        expect(result.sample_size).toBe(n);
+        expect(result.statistic).toBeCloseTo(statistic, 10);
+        expect(Object.values(result.critical_values)).toEqual(criticalValues);
+        expect(result.rejected_at).toBe(rejectedAt);
+      }
+    });
+
+    it('returns a null statistic for constant input', async () => {
+      const result = await worker.request('statistical_tests.anderson', { data: [2, 2, 2, 2, 2] });
+
+      expect(result.success).toBe(true);
+      expect(result.statistic).toBeNull();
+      expect(result.rejected_at).toBeNull();
+      expect(result.significant).toBe(false);
+    });
+
+    it('returns a null statistic for NaN input', async () => {
+      const result = await worker.request('statistical_tests.anderson', { data: [1, NaN, 2, 3, 4] });
+
+      expect(result.success).toBe(true);
+      expect(result.statistic).toBeNull();
+      expect(result.rejected_at).toBeNull();
+      expect(Object.values(result.critical_values)).toEqual([0.452, 0.509, 0.606, 0.704, 0.835]);
+    });
+  });
+});
@@ -0,0 +1,97 @@
+import { spawnSync } from 'child_process';
+import * as path from 'path';
+
+const pythonDir = path.join(__dirname, '../../python');
+
+// Deterministic sample, and its raw native-endian float64 bytes
+const sample = (length: number): number[] =>
+  Array.from({ length }, (_, i) => Math.sin(i * 12.9898));
+const float64Bytes = (values: number[]): Buffer => Buffer.from(new Float64Array(values).buffer);
+
+// Run one of the standalone scripts the way the bridge does
+const run = (script: string, args: string[], input?: Buffer) => {
+  const result = spawnSync('python3', [path.join(pythonDir, script), ...args], {
+    cwd: pythonDir,
+    input
+  });
+
+  return {
+    status: result.status,
+    stdout: result.stdout.toString(),
+    stderr: result.stderr.toString()
+  };
+};
+
+describe('Python scripts', () => {
+  describe('option parsing', () => {
+    it('should accept --name value and --name=value', () => {
+      const result = run('normal_distribution.py', ['--n', '5', '--seed=1']);
+
+      expect(result.status).toBe(0);
+      expect(JSON.parse(result.stdout).values).toHaveLength(5);
+    });
+
+    it('should report bad options as a JSON error with exit code 1', () => {
+      const cases: [string[], string][] = [
+        [['--n', '5', '--bogus', '1'], 'Unknown option: --bogus'],
+        [['--n'], 'Option --n expects a value'],
+        [['--n', 'abc'], 'Invalid value for --n: abc'],
+        [['5'], 'Unexpected argument: 5'],
+        [[], 'Missing required option(s): --n']
+      ];
+
+      for (const [args, error] of cases) {
+        const result = run('normal_distribution.py', args);
+
+        expect(result.status).toBe(1);
+        expect(result.stdout).toBe('');
+        expect(JSON.parse(result.stderr)).toEqual({ error, type: 'ValueError' });
+      }
+    });
+  });
+
+  describe('binary input', () => {
+    it('should read ks_test.py --binary data from stdin', () => {
+      const data = sample(40);
+
+      const json = run('ks_test.py', ['--data', JSON.stringify(data)]);
+      const binary = run('ks_test.py', ['--binary'], float64Bytes(data));
+      const prefix = run('ks_test.py', ['--binary', '--n', '25'], float64Bytes(data));
+
+      expect(binary.status).toBe(0);
+      expect(JSON.parse(binary.stdout)).toEqual(JSON.parse(json.stdout));
+      expect(JSON.parse(prefix.stdout)).toEqual(
+        JSON.parse(run('ks_test.py', ['--data', JSON.stringify(data.slice(0, 25))]).stdout)
+      );
+    });
+
+    it('should split ks_test_batch --binary=<rows> input into rows', () => {
+      const rows = [sample(30), sample(30).map((v) => 2 * v + 1)];
+
+      const json = run('statistical_tests.py', ['ks_test_batch', JSON.stringify(rows), 'norm']);
+      const binary = run(
+        'statistical_tests.py',
+        ['ks_test_batch', '--binary=2', 'norm'],
+        float64Bytes(rows.flat())
+      );
+
+      expect(binary.status).toBe(0);
+      expect(JSON.parse(binary.stdout)).toEqual(JSON.parse(json.stdout));
+      expect(JSON.parse(binary.stdout).n_samples).toBe(2);
+    });
+
+    it('should reject ks_test_batch binary input without a usable row count', () => {
+      const input = float64Bytes(sample(30));
+
+      const bare = run('statistical_tests.py', ['ks_test_batch', '--binary', 'norm'], input);
+      const uneven = run('statistical_tests.py', ['ks_test_batch', '--binary=4', 'norm'], input);
+
+      expect(bare.status).toBe(1);
+      expect(JSON.parse(bare.stdout).error).toBe('ks_test_batch reads binary input as --binary=<rows>');
+      expect(uneven.status).toBe(1);
+      expect(JSON.parse(uneven.stdout).error).toBe(
+        'Binary input of 30 values does not split into 4 equal rows'
+      );
+    });
+  });
+});
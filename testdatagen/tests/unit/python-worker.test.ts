@@ -0,0 +1,99 @@
+import { PythonWorker } from '../../src/utils/python-worker';
+
+describe('PythonWorker', () => {
+  let worker: PythonWorker;
+
+  beforeEach(() => {
+    worker = new PythonWorker();
+  });
+
+  afterEach(() => {
+    worker.close();
+  });
+
+  it('should serve multiple requests from one process', async () => {
+    const normal = await worker.request('generate_normal', { n: 10, mean: 0, std: 1, seed: 42 });
+    const zipf = await worker.request('generate_zipf', { n: 10, a: 1.5, seed: 42 });
+
+    expect(normal.values).toHaveLength(10);
+    expect(zipf.values).toHaveLength(10);
+  });
+
+  it('should resolve concurrent requests by id', async () => {
+    const [small, large] = await Promise.all([
+      worker.request('generate_normal', { n: 5, seed: 1 }),
+      worker.request('generate_normal', { n: 50, seed: 1 })
+    ]);
+
+    expect(small.values).toHaveLength(5);
+    expect(large.values).toHaveLength(50);
+  });
+
+  it('should reproduce seeded Zipf values for small and large n', async () => {
+    // Below and above the size where generation switches to the vectorized sampler
+    for (const n of [10, 5000]) {
+      const first = await worker.request('generate_zipf', { n, a: 2.5, seed: 42 });
+      const second = await worker.request('generate_zipf', { n, a: 2.5, seed: 42 });
+      const int32 = await worker.request('generate_zipf', { n, a: 2.5, seed: 42, dtype: 'int32' });
+
+      expect(first.values).toHaveLength(n);
+      expect(second.values).toEqual(first.values);
+      expect(int32.values).toEqual(first.values);
+    }
+  });
+
+  it('should reject Zipf samples that overflow int32', async () => {
+    for (const n of [100, 5000]) {
+      await expect(
+        worker.request('generate_zipf', { n, a: 1.01, seed: 3, dtype: 'int32' })
+      ).rejects.toThrow('does not fit in int32');
+    }
+  });
+
+  it('should run statistical tests', async () => {
+    const result = await worker.request('statistical_tests.chi_squared', {
+      observed: [24, 26, 25, 25],
+      expected: [25, 25, 25, 25]
+    });
+
+    expect(result.success).toBe(true);
+    expect(result.p_value).toBeGreaterThan(0.05);
+  });
+
+  it('should bin values on bin edges like np.histogram', async () => {
+    // np.linspace(1.7, 3.1, 11): the histogram's own edges, several of which
+    // land in the wrong bin under plain index arithmetic
+    const edges = [1.7, 1.8399999999999999, 1.98, 2.12, 2.26, 2.4, 2.54, 2.68, 2.8200000000000003, 2.96, 3.1];
+    const data = Array.from({ length: 10 }, () => edges).flat();
+
+    const result = await worker.request('statistical_tests.uniformity', { data });
+
+    // np.histogram counts are 10 per bin, and 20 in the closed last bin
+    expect(result.chi_squared_test.statistic).toBe(90 / 11);
+    expect(result.chi_squared_test.degrees_of_freedom).toBe(9);
+  });
+
+  it('should encode non-finite results as null', async () => {
+    const result = await worker.request('statistical_tests.ks_test', { data: [1, 1, 1, 1] });
+
+    expect(result.success).toBe(true);
+    expect(result.statistic).toBeNull();
+    expect(result.p_value).toBeNull();
+  });
+
+  it('should reject failed operations and keep serving', async () => {
+    await expect(worker.request('generate_normal', { n: 10, std: 0 })).rejects.toThrow(
+      'Standard deviation must be positive'
+    );
+    await expect(worker.request('unknown_op')).rejects.toThrow('Unknown operation');
+
+    const result = await worker.request('generate_normal', { n: 3 });
+    expect(result.values).toHaveLength(3);
+  });
+
+  it('should reject requests when Python cannot be started', async () => {
+    const badWorker = new PythonWorker('/nonexistent/python');
+
+    await expect(badWorker.request('generate_normal', { n: 3 })).rejects.toThrow();
+  });
+});
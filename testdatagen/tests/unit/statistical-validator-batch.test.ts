@@ -0,0 +1,84 @@
+import { StatisticalValidator } from '../../src/core/validator/statistical-validator';
+
+// Deterministic, roughly symmetric samples so results are reproducible
+const sample = (length: number, offset: number, scale: number): number[] =>
+  Array.from({ length }, (_, i) => offset + scale * Math.sin(i * 12.9898 + offset));
+
+describe('StatisticalValidator.ksTestBatch', () => {
+  let validator: StatisticalValidator;
+
+  beforeEach(() => {
+    validator = new StatisticalValidator();
+  });
+
+  afterEach(() => {
+    validator.close();
+  });
+
+  it('matches single ksTest calls row by row', async () => {
+    const samples = [sample(50, 0, 1), sample(50, 3, 2), sample(50, -1, 0.5)];
+
+    const batch = await validator.ksTestBatch(samples, 'norm');
+
+    expect(batch.n_samples).toBe(3);
+    expect(batch.sample_size).toBe(50);
+
+    for (let i = 0; i < samples.length; i++) {
+      const single = await validator.ksTest(samples[i], 'norm');
+
+      expect(batch.statistic[i]).toBeCloseTo(single.statistic, 10);
+      expect(batch.p_value[i]).toBeCloseTo(single.p_value, 10);
+      expect(batch.significant[i]).toBe(single.significant);
+    }
+  });
+
+  it('matches single ksTest calls for other distributions', async () => {
+    const samples = [sample(40, 2, 1), sample(40, 5, 1)].map((row) => row.map(Math.abs));
+
+    const batch = await validator.ksTestBatch(samples, 'uniform');
+
+    for (let i = 0; i < samples.length; i++) {
+      const single = await validator.ksTest(samples[i], 'uniform');
+
+      expect(batch.statistic[i]).toBeCloseTo(single.statistic, 10);
+      expect(batch.p_value[i]).toBeCloseTo(single.p_value, 10);
+    }
+  });
+
+  it('treats scalar params as shared by all rows', async () => {
+    const samples = [sample(30, 0, 1), sample(30, 0.5, 1)];
+
+    const scalar = await validator.ksTestBatch(samples, 'norm', { mean: 0, std: 1 });
+    const perRow = await validator.ksTestBatch(samples, 'norm', { mean: [0, 0], std: [1, 1] });
+
+    expect(perRow.statistic).toEqual(scalar.statistic);
+    expect(perRow.p_value).toEqual(scalar.p_value);
+  });
+
+  it('applies per-row params to their own row', async () => {
+    const samples = [sample(30, 0, 1), sample(30, 4, 2)];
+    const means = [0, 4];
+    const stds = [1, 2];
+
+    const batch = await validator.ksTestBatch(samples, 'norm', { mean: means, std: stds });
+
+    for (let i = 0; i < samples.length; i++) {
+      const single = await validator.ksTest(samples[i], 'norm', { mean: means[i], std: stds[i] });
+
+      expect(batch.statistic[i]).toBeCloseTo(single.statistic, 10);
+      expect(batch.p_value[i]).toBeCloseTo(single.p_value, 10);
+    }
+  });
+
+  it('rejects ragged samples', async () => {
+    await expect(validator.ksTestBatch([[1, 2, 3], [1, 2]], 'norm')).rejects.toThrow(
+      'Samples must all have the same length'
+    );
+  });
+
+  it('rejects input that is not 2-D', async () => {
+    await expect(validator.ksTestBatch([1, 2, 3] as any, 'norm')).rejects.toThrow(
+      'Data must be a 2-D array'
+    );
+  });
+});